@@ -1,5 +1,8 @@
 import pygame
 
+# loaded icons, keyed by file name, so that Actors sharing an image share one Surface
+_ICON_CACHE = {}
+
 
 class Actor:
     """
@@ -8,6 +11,8 @@ class Actor:
     x- and y-coordinate.
     """
 
+    __slots__ = ('_icon', '_stage', '_x', '_y', '_delay', '_delay_count')
+
     def __init__(self, icon_file, stage, x, y, delay=5):
         """
         (Actor, str, Stage, int, int, int) -> None
@@ -17,9 +22,13 @@ class Actor:
         update, construct an Actor object.
         """
 
-        self._icon = pygame.image.load(icon_file)  # the image image to display of self
-        self.set_position(x, y)  # self's location on the stage
+        # the image to display of self; converted once to the display's pixel format
+        # (the display must already be set up, which constructing the Stage does)
+        if icon_file not in _ICON_CACHE:
+            _ICON_CACHE[icon_file] = pygame.image.load(icon_file).convert_alpha()
+        self._icon = _ICON_CACHE[icon_file]
         self._stage = stage  # the stage that self is on
+        (self._x, self._y) = (x, y)  # self's location on the stage
 
         # the following can be used to change this Actors 'speed' relative to other
         # actors speed. See the delay method.
@@ -32,6 +41,7 @@ class Actor:
         Set the position of this Actor to the given x- and y-coordinates.
         """
 
+        self._stage.update_position(self, x, y)  # keep the stage's grid in sync
         (self._x, self._y) = (x, y)
 
     def get_position(self):
@@ -82,8 +92,11 @@ class Actor:
         then we actually do something. Otherwise, we simply return from the step method.
         """
 
-        self._delay_count = (self._delay_count + 1) % self._delay
-        return self._delay_count == 0
+        count = self._delay_count + 1
+        if count >= self._delay:  # wrap around without paying for a modulo
+            count = 0
+        self._delay_count = count
+        return count == 0
 
     def step(self):
         """
@@ -102,15 +115,25 @@ class Player(Actor):
     from the user, for example, key presses etc.
     """
 
+    __slots__ = ('_dead',)
+
     def __init__(self, icon_file, stage, x=0, y=0):
         """
         (Player, str, Stage, int, int) -> None
         Construct a Player with given image, on the given stage, at
         x- and y- position.
         """
-        self.is_dead = False
+        self._dead = False
         super().__init__(icon_file, stage, x, y)
 
+    def is_dead(self):
+        """
+        (Player) -> bool
+        Return True iff this Player is not alive.
+        """
+
+        return self._dead
+
     def handle_event(self, event):
         """
         Used to register the occurrence of an event with self.
@@ -124,6 +147,20 @@ class KeyboardPlayer(Player):
     A KeyboardPlayer is a Player that can handle keypress events.
     """
 
+    __slots__ = ('_last_event',)
+
+    # the (dx, dy) that each movement key moves the player by
+    _KEYMAP = {
+        pygame.K_s: (0, 1),  # DOWN
+        pygame.K_a: (-1, 0),  # LEFT
+        pygame.K_d: (1, 0),  # RIGHT
+        pygame.K_w: (0, -1),  # UP
+        pygame.K_e: (1, -1),  # UP and RIGHT
+        pygame.K_q: (-1, -1),  # UP and LEFT
+        pygame.K_x: (1, 1),  # DOWN and RIGHT
+        pygame.K_z: (-1, 1),  # DOWN and LEFT
+    }
+
     def __init__(self, icon_file, stage, x=0, y=0):
         """
         Construct a KeyboardPlayer. Other than the given Player information,
@@ -148,31 +185,10 @@ class KeyboardPlayer(Player):
         Take a single step in the animation.
         For example: if the user asked us to move right, then we do that.
         """
-        if 'Monster' in str(self):
-            self.remove()
-
-        if self._last_event is not None:
-            dx, dy = None, None
-            if self._last_event == pygame.K_s:  # Player moves DOWN with s key
-                dx, dy = 0, 1
-            if self._last_event == pygame.K_a:  # Player moves LEFT with a key
-                dx, dy = -1, 0
-            if self._last_event == pygame.K_d:  # Player moves RIGHT with d key
-                dx, dy = 1, 0
-            if self._last_event == pygame.K_w:  # Player moves UP with w key
-                dx, dy = 0, -1
-            if self._last_event == pygame.K_e:  # Player moves UP and RIGHT with key e
-                dx, dy = 1, -1
-            if self._last_event == pygame.K_q:  # Player moves UP and LEFT with key q
-                dx, dy = -1, -1
-            if self._last_event == pygame.K_x:  # Player moves DOWN and RIGHT with key x
-                dx, dy = 1, 1
-            if self._last_event == pygame.K_z:  # Player moves DOWN and LEFT with key z
-                dx, dy = -1, 1
-            if dx is not None and dy is not None:
-                self.move(self, dx, dy)  # we are asking ourself to move
-
-            self._last_event = None
+        event, self._last_event = self._last_event, None
+        direction = self._KEYMAP.get(event)
+        if direction is not None:
+            self.move(self, *direction)  # we are asking ourself to move
 
     def move(self, other, dx, dy):
         """
@@ -189,13 +205,13 @@ class KeyboardPlayer(Player):
         new_y = self._y + dy
         actor = self._stage.get_actor(new_x, new_y)
 
-        if not self._stage.is_in_bounds(new_x, new_y) or 'Wall' in str(actor):
+        if not self._stage.is_in_bounds(new_x, new_y) or isinstance(actor, Wall):
             return False
 
-        if 'Player' in str(self) and 'Monster' in str(actor):
+        if isinstance(self, Player) and isinstance(actor, Monster):
             self._stage.remove_player()
 
-        if 'Box' in str(actor):
+        if isinstance(actor, (Box, Sticky_Box)):
             act = actor.move(actor, dx, dy)
 
         if not act:
@@ -209,6 +225,8 @@ class Box(Actor):
     A Box Actor.
     """
 
+    __slots__ = ()
+
     def __init__(self, icon_file, stage, x=0, y=0):
         """
         (Actor, str, Stage, int, int) -> None
@@ -233,10 +251,10 @@ class Box(Actor):
 
         actor = self._stage.get_actor(new_x, new_y)
 
-        if not self._stage.is_in_bounds(new_x, new_y) or 'Wall' in str(actor) or 'Monster' in str(actor):
+        if not self._stage.is_in_bounds(new_x, new_y) or isinstance(actor, (Wall, Monster)):
             return False
 
-        if 'Box' in str(actor):
+        if isinstance(actor, (Box, Sticky_Box)):
             act = actor.move(actor, dx, dy)
 
         if not act:
@@ -250,6 +268,8 @@ class Sticky_Box(Actor):
     A Box Actor.
     """
 
+    __slots__ = ('_stuck',)
+
     def __init__(self, icon_file, stage, x=0, y=0):
         """
         (Actor, str, Stage, int, int) -> None
@@ -275,19 +295,17 @@ class Sticky_Box(Actor):
 
         actor = self._stage.get_actor(new_x, new_y)
 
-        if not self._stage.is_in_bounds(new_x, new_y) or 'Wall' in str(actor) or 'Monster' in str(actor):
-            if 'Monster' in str(actor):
+        if not self._stage.is_in_bounds(new_x, new_y) or isinstance(actor, (Wall, Monster)):
+            if isinstance(actor, Monster):
                 self._stuck = actor
                 actor.is_stuck = True
             return False
 
         if self._stuck is not None:
-            for act in self._stage._actors:
-                if act == self._stuck:
-                    act.is_stuck = False
+            self._stuck.is_stuck = False
             self._stuck = None
 
-        if 'Box' in str(actor):
+        if isinstance(actor, (Box, Sticky_Box)):
             act = actor.move(actor, dx, dy)
 
         if not act:
@@ -297,6 +315,8 @@ class Sticky_Box(Actor):
 
 
 class Wall(Actor):
+    __slots__ = ()
+
     def __init__(self, icon_file, stage, x=0, y=0):
         """
         (Actor, str, Stage, int, int) -> None
@@ -314,8 +334,15 @@ class Stage:
     def __init__(self, width, height, icon_dimension):
         '''Construct a Stage with the given dimensions.'''
 
-        self._actors = []  # all actors on this stage (monsters, player, boxes, ...)
+        # all actors on this stage (monsters, player, boxes, ...), keyed by id(actor);
+        # dicts keep insertion order, so actors still step and draw in the order added
+        self._actors = {}
+        self._grid = {}  # maps (x, y) to the actor at that position
+        self._gen = 0  # bumped whenever an actor is added, removed or moved
+        self._dirty = set()  # (x, y) cells that changed since the last draw
+        self._drawn = False  # whether the whole stage has been drawn once yet
         self._player = None  # a special actor, the player
+        self._monster_count = 0  # how many Monsters are on this stage
 
         # the logical width and height of the stage
         self._width, self._height = width, height
@@ -368,6 +395,14 @@ class Stage:
 
         return self._height
 
+    def get_generation(self):
+        """
+        (Stage) -> int
+        Return a counter that changes whenever an actor is added, removed or moved.
+        """
+
+        return self._gen
+
     def set_player(self, player):
         """
         (Stage, Player) -> None
@@ -401,7 +436,27 @@ class Stage:
         Add the given actor to the Stage.
         """
 
-        self._actors.append(actor)
+        self._actors[id(actor)] = actor
+        if isinstance(actor, Monster):
+            self._monster_count += 1
+        self._grid[actor.get_position()] = actor
+        self._dirty.add(actor.get_position())
+        self._gen += 1
+
+    def update_position(self, actor, x, y):
+        """
+        (Stage, Actor, int, int) -> None
+        Record that the given actor is moving to (x, y).
+        Actors that are not on this Stage are ignored.
+        """
+
+        position = actor.get_position()
+        if self._grid.get(position) is actor:
+            del self._grid[position]
+            self._grid[(x, y)] = actor
+            self._dirty.add(position)
+            self._dirty.add((x, y))
+            self._gen += 1
 
     def game_over_win(self):
         """
@@ -409,10 +464,7 @@ class Stage:
         Returns True if the game is over because the player
         has killed all the monsters
         """
-        for item in self._actors:
-            if 'Monster' in str(item):
-                return False
-        return True
+        return self._monster_count == 0
 
     def game_over_lose(self):
         """
@@ -420,10 +472,7 @@ class Stage:
         Returns True if the game is over because the player
         has died
         """
-        for item in self._actors:
-            if 'Player' in str(item):
-                return False
-        return True
+        return self._player is None
 
     def remove_actor(self, actor):
         """
@@ -431,7 +480,14 @@ class Stage:
         Remove the given actor from the Stage.
         """
 
-        self._actors.remove(actor)
+        del self._actors[id(actor)]
+        if isinstance(actor, Monster):
+            self._monster_count -= 1
+        position = actor.get_position()
+        if self._grid.get(position) is actor:
+            del self._grid[position]
+        self._dirty.add(position)
+        self._gen += 1
 
     def step(self):
         """
@@ -440,8 +496,11 @@ class Stage:
         Do this by asking each of the actors on this Stage to take a single step.
         """
 
-        for a in self._actors:
-            a.step()
+        # step over a copy, since actors may be removed part way through;
+        # skip any that were removed before their turn came
+        for a in list(self._actors.values()):
+            if id(a) in self._actors:
+                a.step()
 
     def get_actors(self):
         """
@@ -449,39 +508,67 @@ class Stage:
         Return the list of Actors on this Stage.
         """
 
-        return self._actors
+        return list(self._actors.values())
 
     def get_actor(self, x, y):
         """
         (Stage, int, int) -> Actor or None
-        Return the first actor at coordinates (x,y).
+        Return the actor at coordinates (x,y).
         Or, return None if there is no Actor in that position.
         """
 
-        for a in self._actors:
-            if a.get_position() == (x, y):
-                return a
-        return None
+        return self._grid.get((x, y))
 
-    def draw(self):
+    def redraw_all(self):
         """
         (Stage) -> None
-        Draw all Actors that are part of this Stage to the screen.
+        Make the next draw repaint the whole stage and push all of it to the display,
+        for example after the window was covered and its contents were lost.
         """
 
-        self._screen.fill((0, 0, 0))  # (0,0,0)=(r,g,b)=black
-        for a in self._actors:
-            icon = a.get_icon()
-            (x, y) = a.get_position()
-            d = self._icon_dimension
+        self._drawn = False
+
+    def draw(self):
+        """
+        (Stage) -> None
+        Draw all Actors that are part of this Stage to the screen.
+        After a full draw, only the cells that changed since the last draw
+        are redrawn and pushed to the display, until redraw_all is called.
+        """
+
+        d = self._icon_dimension
+        if not self._drawn:
+            self._screen.fill((0, 0, 0))  # (0,0,0)=(r,g,b)=black
+            # hand every (icon, pixel position) pair to pygame in a single call
+            blits = []
+            for a in self._actors.values():
+                (x, y) = a.get_position()
+                blits.append((a.get_icon(), (x * d, y * d)))
+            self._screen.blits(blits, doreturn=False)
+            pygame.display.flip()
+            self._drawn = True
+            self._dirty.clear()
+            return
+
+        rects = []
+        blits = []
+        for (x, y) in self._dirty:
             rect = pygame.Rect(x * d, y * d, d, d)
-            self._screen.blit(icon, rect)
-        pygame.display.flip()
+            self._screen.fill((0, 0, 0), rect)  # clear the cell, then redraw its occupant
+            rects.append(rect)
+            actor = self._grid.get((x, y))
+            if actor is not None:
+                blits.append((actor.get_icon(), rect))
+        self._screen.blits(blits, doreturn=False)
+        self._dirty.clear()
+        pygame.display.update(rects)
 
 
 class Monster(Actor):
     """A Monster class."""
 
+    __slots__ = ('is_stuck', '_dx', '_dy', '_isdead_gen', '_isdead_cached')
+
     def __init__(self, icon_file, stage, x=0, y=0, delay=5):
         '''Construct a Monster.'''
 
@@ -490,6 +577,10 @@ class Monster(Actor):
         self._dx = 1
         self._dy = 1
 
+        # the result of the last is_dead check, and the Stage generation it was made at
+        self._isdead_gen = -1
+        self._isdead_cached = False
+
     def step(self):
         """
         Take one step in the animation (this Monster moves by one space).
@@ -540,13 +631,13 @@ class Monster(Actor):
         if actor is not None:
             self._dx = - self._dx
             self._dy = - self._dy
-        if 'Box' in str(actor) or 'Monster' in str(actor) or 'Wall' in str(actor):
-            if 'Sticky_Box' in str(actor):
+        if isinstance(actor, (Box, Sticky_Box, Monster, Wall)):
+            if isinstance(actor, Sticky_Box):
                 actor._stuck = self
                 self.is_stuck = True
             return False
 
-        if 'Player' in str(actor):
+        if isinstance(actor, Player):
             self._stage.remove_player()
 
         return super().move(other, dx, dy)
@@ -555,45 +646,34 @@ class Monster(Actor):
         """
         Return whether this Monster has died.
         That is, if self is surrounded on all sides, by either Boxes or
-        other Monsters."""
-
-        d_dx, d_dy = 0, 1
-        l_dx, l_dy = -1, 0
-        r_dx, r_dy = 1, 0
-        u_dx, u_dy = 0, -1
-        ur_dx, ur_dy = 1, -1
-        ul_dx, ul_dy = -1, -1
-        dr_dx, dr_dy = 1, 1
-        dl_dx, dl_dy = -1, 1
-
-        d_actor = self._stage.get_actor(self._x + d_dx, self._y + d_dy)
-        l_actor = self._stage.get_actor(self._x + l_dx, self._y + l_dy)
-        r_actor = self._stage.get_actor(self._x + r_dx, self._y + r_dy)
-        u_actor = self._stage.get_actor(self._x + u_dx, self._y + u_dy)
-        ur_actor = self._stage.get_actor(self._x + ur_dx, self._y + ur_dy)
-        ul_actor = self._stage.get_actor(self._x + ul_dx, self._y + ul_dy)
-        dr_actor = self._stage.get_actor(self._x + dr_dx, self._y + dr_dy)
-        dl_actor = self._stage.get_actor(self._x + dl_dx, self._y + dl_dy)
-
-        if (d_actor is None or 'Player' in str(d_actor)) and self._stage.is_in_bounds_y(self._y + d_dy):
-            return False
-        if (u_actor is None or 'Player' in str(u_actor)) and self._stage.is_in_bounds_y(self._y + u_dy):
-            return False
-        if (l_actor is None or 'Player' in str(l_actor)) and self._stage.is_in_bounds_x(self._x + l_dx):
-            return False
-        if (r_actor is None or 'Player' in str(r_actor)) and self._stage.is_in_bounds_x(self._x + r_dx):
-            return False
-        if (ur_actor is None or 'Player' in str(ur_actor)) and self._stage.is_in_bounds(self._x + ur_dx,
-                                                                                        self._y + ur_dy):
-            return False
-        if (ul_actor is None or 'Player' in str(ul_actor)) and self._stage.is_in_bounds(self._x + ul_dx,
-                                                                                        self._y + ul_dy):
-            return False
-        if (dr_actor is None or 'Player' in str(dr_actor)) and self._stage.is_in_bounds(self._x + dr_dx,
-                                                                                        self._y + dr_dy):
-            return False
-        if (dl_actor is None or 'Player' in str(dl_actor)) and self._stage.is_in_bounds(self._x + dl_dx,
-                                                                                        self._y + dl_dy):
-            return False
+        other Monsters.
+        The answer is reused until an actor on the Stage is added, removed or moved."""
+
+        generation = self._stage.get_generation()
+        if self._isdead_gen == generation:
+            return self._isdead_cached
+
+        self._isdead_gen = generation
+        self._isdead_cached = self._check_dead()
+        return self._isdead_cached
+
+    def _check_dead(self):
+        """
+        (Monster) -> bool
+        Return whether self is surrounded, by looking at all eight neighbouring cells.
+        """
+
+        width, height = self._stage.get_width(), self._stage.get_height()
+
+        # down, up, left, right, up-right, up-left, down-right, down-left
+        for dx, dy in ((0, 1), (0, -1), (-1, 0), (1, 0), (1, -1), (-1, -1), (1, 1), (-1, 1)):
+            nx, ny = self._x + dx, self._y + dy
+            # only bounds check the axes the neighbour is offset along, so up/down
+            # ignores x and left/right ignores y; a Monster placed off the edge of
+            # the stage always has an open neighbour along that edge
+            if (dx == 0 or 0 <= nx < width) and (dy == 0 or 0 <= ny < height):
+                actor = self._stage.get_actor(nx, ny)
+                if actor is None or isinstance(actor, Player):
+                    return False  # an open space, self can still get away
 
         return True
@@ -12,24 +12,18 @@ ww.add_actor(Monster("icons/face-devil-grin-24.png", ww, 7, 4, 5))
 ww.add_actor(Monster("icons/face-devil-grin-24.png", ww, 4, 10, 3))
 ww.add_actor(Monster("icons/face-devil-grin-24.png", ww, 5, 20, 2))
 
-num_walls=0
-while num_walls<10:
-    x=random.randrange(ww.get_width())
-    y=random.randrange(ww.get_height())
-    if ww.get_actor(x,y) is None:
-        ww.add_actor(Wall("icons/wall.jpg", ww, x, y))
-        num_walls+=1
+# pick distinct free cells for the walls, sticky boxes and boxes in one go
+occupied={a.get_position() for a in ww.get_actors()}
+free=[(x,y) for x in range(ww.get_width()) for y in range(ww.get_height()) if (x,y) not in occupied]
+cells=random.sample(free, 10+10+100)
 
-num_sticky_boxes=0
-while num_sticky_boxes<10:
-    x=random.randrange(ww.get_width())
-    y=random.randrange(ww.get_height())
-    if ww.get_actor(x,y) is None:
-        ww.add_actor(Sticky_Box("icons/emblem-package-sticky-2-24.png", ww, x, y))
-        num_sticky_boxes+=1
+for x,y in cells[:10]:
+    ww.add_actor(Wall("icons/wall.jpg", ww, x, y))
+
+for x,y in cells[10:20]:
+    ww.add_actor(Sticky_Box("icons/emblem-package-sticky-2-24.png", ww, x, y))
 
 def game_over(msg):
-    pygame.init()
     DISPLAYSURF = pygame.display.set_mode((600, 500))
     pygame.display.set_caption('Game Over!')
 
@@ -41,9 +35,12 @@ def game_over(msg):
     textRectObj = textSurfaceObj.get_rect()
     textRectObj.center = (300, 250)
 
+    DISPLAYSURF.fill(WHITE) #the message never changes, so draw it just once
+    DISPLAYSURF.blit(textSurfaceObj, textRectObj)
+
+    clock = pygame.time.Clock()
     while True:
-        DISPLAYSURF.fill(WHITE)
-        DISPLAYSURF.blit(textSurfaceObj, textRectObj)
+        clock.tick(30) #no need to spin any faster while waiting to quit
         for event in pygame.event.get():
             if event.type == QUIT:
                 pygame.quit()
@@ -51,26 +48,30 @@ def game_over(msg):
         pygame.display.update()
 
 # YOUR COMMENT GOES HERE. BRIEFLY DESCRIBE WHAT THE FOLLOWING LOOP DOES.
-num_boxes=0
-while num_boxes<100: #As long as the num_boxes is less than 100
-    x=random.randrange(ww.get_width()) #generates a random number from 0 to the width of the playing field and stores in x-coordinate
-    y=random.randrange(ww.get_height()) #generates a random number from 0 to the height of the playing field ans stores in y-coordinate
-    if ww.get_actor(x,y) is None: #if no actor in the random position
-        ww.add_actor(Box("icons/emblem-package-2-24.png", ww, x, y)) #add actor in the free space
-        num_boxes+=1 #add 1 to num_boxes counter
+for x,y in cells[20:]: #for each of the 100 remaining free cells picked above
+    ww.add_actor(Box("icons/emblem-package-2-24.png", ww, x, y)) #add a box in the free space
 
 # YOUR COMMENT GOES HERE. BRIEFLY DESCRIBE WHAT THE FOLLOWING LOOP DOES.
+clock=pygame.time.Clock() #paces the loop below to a fixed frame rate
+EXPOSE_EVENTS=(pygame.VIDEOEXPOSE,) #the window was uncovered and may need repainting
+if hasattr(pygame, 'WINDOWEXPOSED'): #pygame 2 also reports this as a window event
+    EXPOSE_EVENTS+=(pygame.WINDOWEXPOSED,)
+GAME_EVENTS=(pygame.QUIT, pygame.KEYDOWN)+EXPOSE_EVENTS
+pygame.event.set_blocked(None) #block every event type at the SDL layer, so the queue cannot fill up with ignored events
+pygame.event.set_allowed(list(GAME_EVENTS)) #then let back in the only ones the game uses
 while True:
-    pygame.time.wait(100)
-    for event in pygame.event.get(): #for every event that occurs in the game
-        if event.type == pygame.QUIT or ww.game_over_lose() or ww.game_over_win():  #if the event is either to QUIT, player LOST, or player WON, then proceed
-            if ww.game_over_win(): #if the player WON
-                game_over('All monsters died, You WIN!') #Send game over for winner message
-            if ww.game_over_lose(): #if the player LOST
-                game_over('Game Over, you DIED!') # Send game over for loser message
-            pygame.quit() #if the game is QUIT
+    clock.tick(10) #wait out whatever is left of this frame's 100ms, minus the time step and draw took
+    if ww.game_over_win(): #if the player WON
+        game_over('All monsters died, You WIN!') #Send game over for winner message
+    if ww.game_over_lose(): #if the player LOST
+        game_over('Game Over, you DIED!') # Send game over for loser message
+    for event in pygame.event.get(GAME_EVENTS): #for every QUIT, KEYDOWN or expose event that occurs in the game
+        if event.type == pygame.QUIT: #if the game is QUIT
+            pygame.quit()
             sys.exit(0) #Exit
         if event.type == pygame.KEYDOWN:
             ww.player_event(event.key)
+        if event.type in EXPOSE_EVENTS: #the window was uncovered and may have lost its contents
+            ww.redraw_all()
     ww.step()
     ww.draw()